@@ -1,4 +1,14 @@
-from typing import Dict, Any, List, Optional, Union, Type, Mapping
+from typing import (
+    Dict,
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Union,
+    Type,
+    Mapping,
+    Tuple,
+)
 
 from pydantic import BaseModel, Field
 from pymongo import (
@@ -9,6 +19,12 @@ from pymongo import (
     UpdateOne,
     UpdateMany,
 )
+from pymongo.collection import Collection
+from pymongo.write_concern import WriteConcern
+
+WriteRequest = Union[
+    InsertOne, DeleteOne, DeleteMany, ReplaceOne, UpdateOne, UpdateMany
+]
 
 
 class Operation(BaseModel):
@@ -28,38 +44,121 @@ class Operation(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+    def to_request(self) -> WriteRequest:
+        """
+        Build the pymongo write request for this operation
+        """
+        if self.operation in [InsertOne, DeleteOne, DeleteMany]:
+            return self.operation(  # type: ignore
+                self.first_query, **self.pymongo_kwargs
+            )
+        return self.operation(
+            self.first_query,
+            self.second_query,  # type: ignore
+            **self.pymongo_kwargs,
+        )
+
 
 class BulkWriter:
-    def __init__(self):
-        self.operations: List[Operation] = []
+    """
+    Bulk writer. Collects write requests and sends them to the database
+    with a single `bulk_write` call per collection on commit
+
+    :param ordered: bool - if the requests of a collection should be
+    executed in the order they were added. Default - True
+    :param max_batch_size: int - the collected requests are committed
+    automatically when their number reaches this value. Default - 1000
+    :param bypass_document_validation: bool - skip the server side
+    document validation. Default - False
+    :param write_concern: Optional[WriteConcern] - write concern of the
+    bulk writes. WriteConcern(w=0) disables acknowledgement.
+    Default - the write concern of the collection
+    """
+
+    def __init__(
+        self,
+        ordered: bool = True,
+        max_batch_size: int = 1000,
+        bypass_document_validation: bool = False,
+        write_concern: Optional[WriteConcern] = None,
+    ):
+        self.ordered = ordered
+        self.max_batch_size = max_batch_size
+        self.bypass_document_validation = bypass_document_validation
+        self.write_concern = write_concern
+        self.ops: List[Tuple[Collection, WriteRequest]] = []
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc, tb):
-        self.commit()
+        if exc_type is None:
+            self.commit()
 
     def commit(self):
-        obj_class = None
-        requests = []
-        if self.operations:
-            for op in self.operations:
-                if obj_class is None:
-                    obj_class = op.object_class
-
-                if obj_class != op.object_class:
-                    raise ValueError(
-                        "All the operations should be for a single document model"
-                    )
-                if op.operation in [InsertOne, DeleteOne]:
-                    query = op.operation(op.first_query, **op.pymongo_kwargs)
-                else:
-                    query = op.operation(
-                        op.first_query, op.second_query, **op.pymongo_kwargs
+        """
+        Send all the collected requests to the database.
+        If a `bulk_write` call fails, the requests of the failed collection
+        are dropped, as the server could have applied a part of them -
+        `BulkWriteError.details` describes what was written. The requests
+        of the collections which were not sent yet stay in the writer
+        """
+        requests: Dict[Collection, List[WriteRequest]] = {}
+        for collection, request in self.ops:
+            requests.setdefault(collection, []).append(request)
+        try:
+            for collection in list(requests):
+                collection_requests = requests.pop(collection)
+                if self.write_concern is not None:
+                    collection = collection.with_options(
+                        write_concern=self.write_concern
                     )
-                requests.append(query)
+                collection.bulk_write(
+                    collection_requests,
+                    ordered=self.ordered,
+                    bypass_document_validation=self.bypass_document_validation,
+                )
+        finally:
+            self.ops = [
+                (collection, request)
+                for collection, collection_requests in requests.items()
+                for request in collection_requests
+            ]
+
+    def add_request(self, collection: Collection, request: WriteRequest):
+        """
+        Add a prebuilt pymongo write request
+
+        :param collection: Collection - target pymongo collection
+        :param request: pymongo write request (InsertOne, UpdateOne, etc.)
+        """
+        self.ops.append((collection, request))
+        if len(self.ops) >= self.max_batch_size:
+            self.commit()
+
+    def extend(self, collection: Collection, requests: Iterable[WriteRequest]):
+        """
+        Add many prebuilt pymongo write requests for the same collection.
+        `UpdateQuery.to_pymongo_op` does not support upsert queries
+        with an `on_insert` document
+
+        Example:
+
+        ```python
+        bulk_writer.extend(
+            Sample.get_motor_collection(),
+            (query.to_pymongo_op() for query in update_queries),
+        )
+        ```
 
-            obj_class.get_motor_collection().bulk_write(requests)  # type: ignore
+        :param collection: Collection - target pymongo collection
+        :param requests: Iterable of pymongo write requests
+        """
+        for request in requests:
+            self.add_request(collection, request)
 
     def add_operation(self, operation: Operation):
-        self.operations.append(operation)
+        self.add_request(
+            operation.object_class.get_motor_collection(),
+            operation.to_request(),
+        )
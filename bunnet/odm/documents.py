@@ -1,4 +1,5 @@
 import inspect
+from threading import Lock
 from typing import ClassVar, AbstractSet
 from typing import (
     Dict,
@@ -52,7 +53,7 @@ from bunnet.odm.actions import (
     ActionRegistry,
     ActionDirections,
 )
-from bunnet.odm.bulk import BulkWriter, Operation
+from bunnet.odm.bulk import BulkWriter
 from bunnet.odm.cache import LRUCache
 from bunnet.odm.fields import (
     Link,
@@ -78,6 +79,7 @@ from bunnet.odm.queries.update import UpdateMany
 
 from bunnet.odm.settings.document import DocumentSettings
 from bunnet.odm.utils.dump import get_dict
+from bunnet.odm.utils.encoder import Encoder
 from bunnet.odm.utils.relations import detect_link
 from bunnet.odm.utils.self_validation import validate_self_before
 from bunnet.odm.utils.state import (
@@ -93,6 +95,8 @@ if TYPE_CHECKING:
 DocType = TypeVar("DocType", bound="Document")
 DocumentProjectionType = TypeVar("DocumentProjectionType", bound=BaseModel)
 
+_update_encoder_lock = Lock()
+
 
 class Document(
     BaseModel,
@@ -134,6 +138,7 @@ class Document(
 
     # Other
     _hidden_fields: ClassVar[Set[str]] = set()
+    _cached_update_encoder: ClassVar[Optional[Encoder]] = None
 
     def _swap_revision(self):
         if self.get_settings().use_revision:
@@ -271,12 +276,9 @@ class Document(
                 raise NotSupported(
                     "Cascade insert with bulk writing not supported"
                 )
-            bulk_writer.add_operation(
-                Operation(
-                    operation=InsertOne,
-                    first_query=get_dict(document, to_db=True),
-                    object_class=type(document),
-                )
+            bulk_writer.add_request(
+                document.get_motor_collection(),
+                InsertOne(get_dict(document, to_db=True)),
             )
             return None
 
@@ -860,6 +862,7 @@ class Document(
             document_model=cls,
             allow_index_dropping=allow_index_dropping,
         )
+        cls._cached_update_encoder = None
 
     @classmethod
     def init_actions(cls):
@@ -909,6 +912,25 @@ class Document(
             raise CollectionWasNotInitialized
         return cls._document_settings
 
+    @classmethod
+    def _get_update_encoder(cls) -> Encoder:
+        """
+        Get the encoder for update queries of this model.
+        It is created once per model class and shared by all the queries
+
+        :return: Encoder
+        """
+        encoder = cls.__dict__.get("_cached_update_encoder")
+        if encoder is None:
+            with _update_encoder_lock:
+                encoder = cls.__dict__.get("_cached_update_encoder")
+                if encoder is None:
+                    encoder = Encoder(
+                        custom_encoders=cls.get_settings().bson_encoders
+                    )
+                    cls._cached_update_encoder = encoder
+        return encoder
+
     @classmethod
     def inspect_collection(
         cls, session: Optional[ClientSession] = None
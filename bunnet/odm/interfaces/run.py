@@ -1,4 +1,6 @@
 class RunInterface:
+    __slots__ = ()
+
     def run(self):
         raise NotImplementedError
 
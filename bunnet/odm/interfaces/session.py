@@ -8,6 +8,8 @@ class SessionMethods:
     Session methods
     """
 
+    __slots__ = ("session",)
+
     def set_session(self, session: Optional[ClientSession] = None):
         """
         Set pymongo session
@@ -17,6 +17,8 @@ class UpdateMethods:
     Update methods
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def update(
         self,
@@ -10,7 +10,7 @@ from typing import (
 
 from pymongo.results import DeleteResult
 
-from bunnet.odm.bulk import BulkWriter, Operation
+from bunnet.odm.bulk import BulkWriter
 from bunnet.odm.interfaces.run import RunInterface
 from bunnet.odm.interfaces.session import SessionMethods
 from pymongo import DeleteOne as DeleteOnePyMongo
@@ -50,13 +50,9 @@ class DeleteMany(DeleteQuery):
                 self.find_query, session=self.session, **self.pymongo_kwargs
             )
         else:
-            self.bulk_writer.add_operation(
-                Operation(
-                    operation=DeleteManyPyMongo,
-                    first_query=self.find_query,
-                    object_class=self.document_model,
-                    pymongo_kwargs=self.pymongo_kwargs,
-                )
+            self.bulk_writer.add_request(
+                self.document_model.get_motor_collection(),
+                DeleteManyPyMongo(self.find_query, **self.pymongo_kwargs),
             )
             return None
 
@@ -72,12 +68,8 @@ class DeleteOne(DeleteQuery):
                 self.find_query, session=self.session, **self.pymongo_kwargs
             )
         else:
-            self.bulk_writer.add_operation(
-                Operation(
-                    operation=DeleteOnePyMongo,
-                    first_query=self.find_query,
-                    object_class=self.document_model,
-                    pymongo_kwargs=self.pymongo_kwargs,
-                )
+            self.bulk_writer.add_request(
+                self.document_model.get_motor_collection(),
+                DeleteOnePyMongo(self.find_query, **self.pymongo_kwargs),
             )
             return None
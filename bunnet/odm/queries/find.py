@@ -23,7 +23,7 @@ from pymongo import ReplaceOne
 
 from bunnet.exceptions import DocumentNotFound
 from bunnet.odm.cache import LRUCache
-from bunnet.odm.bulk import BulkWriter, Operation
+from bunnet.odm.bulk import BulkWriter
 from bunnet.odm.enums import SortDirection
 from bunnet.odm.interfaces.aggregation_methods import AggregateMethods
 from bunnet.odm.interfaces.run import RunInterface
@@ -811,16 +811,13 @@ class FindOne(FindQuery[FindQueryResultType], RunInterface):
                 raise DocumentNotFound
             return result
         else:
-            bulk_writer.add_operation(
-                Operation(
-                    operation=ReplaceOne,
-                    first_query=self.get_filter_query(),
-                    second_query=Encoder(
-                        by_alias=True, exclude={"_id"}
-                    ).encode(document),
-                    object_class=self.document_model,
-                    pymongo_kwargs=self.pymongo_kwargs,
-                )
+            bulk_writer.add_request(
+                self.document_model.get_motor_collection(),
+                ReplaceOne(
+                    self.get_filter_query(),
+                    Encoder(by_alias=True, exclude={"_id"}).encode(document),
+                    **self.pymongo_kwargs,
+                ),
             )
             return None
 
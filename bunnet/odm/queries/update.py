@@ -1,9 +1,10 @@
 from abc import abstractmethod
+from types import MappingProxyType
 
 
-from bunnet.odm.bulk import BulkWriter, Operation
+from bunnet.exceptions import NotSupported
+from bunnet.odm.bulk import BulkWriter
 from bunnet.odm.interfaces.run import RunInterface
-from bunnet.odm.utils.encoder import Encoder
 from typing import (
     Callable,
     List,
@@ -24,12 +25,15 @@ from bunnet.odm.interfaces.update import (
     UpdateMethods,
 )
 from bunnet.odm.operators.update import BaseUpdateOperator
+from bunnet.odm.utils.encoder import is_bson_primitive
 from pymongo import UpdateOne as UpdateOnePyMongo
 from pymongo import UpdateMany as UpdateManyPyMongo
 
 if TYPE_CHECKING:
     from bunnet.odm.documents import DocType
 
+_EMPTY_KWARGS: Mapping[str, Any] = MappingProxyType({})
+
 
 class UpdateQuery(UpdateMethods, SessionMethods, RunInterface):
     """
@@ -41,6 +45,22 @@ class UpdateQuery(UpdateMethods, SessionMethods, RunInterface):
     - [UpdateMethods](https://roman-right.github.io/bunnet/api/interfaces/#aggregatemethods)
     """
 
+    __slots__ = (
+        "document_model",
+        "find_query",
+        "update_expressions",
+        "is_upsert",
+        "upsert_insert_doc",
+        "encoders",
+        "bulk_writer",
+        "pymongo_kwargs",
+        "_encoder",
+        "_merged",
+        "_version",
+        "_cached_update_query",
+        "_cached_version",
+    )
+
     def __init__(
         self,
         document_model: Type["DocType"],
@@ -55,19 +75,34 @@ class UpdateQuery(UpdateMethods, SessionMethods, RunInterface):
         self.encoders: Dict[Any, Callable[[Any], Any]] = {}
         self.bulk_writer: Optional[BulkWriter] = None
         self.encoders = self.document_model.get_settings().bson_encoders
-        self.pymongo_kwargs: Dict[str, Any] = {}
+        self.pymongo_kwargs: Mapping[str, Any] = _EMPTY_KWARGS
+        self._encoder = self.document_model._get_update_encoder()
+        self._merged: Dict[str, Any] = {}
+        self._version = 0
+        self._cached_update_query: Optional[Dict[str, Any]] = None
+        self._cached_version = 0
+
+    def _build_update_query(self) -> Dict[str, Any]:
+        query = dict(self._merged)
+        if not self.encoders and all(
+            isinstance(fields, dict)
+            and all(is_bson_primitive(value) for value in fields.values())
+            for fields in query.values()
+        ):
+            self._cached_update_query = query
+        else:
+            self._cached_update_query = self._encoder.encode(query)
+        self._cached_version = self._version
+        return self._cached_update_query
 
     @property
     def update_query(self) -> Dict[str, Any]:
-        query: Dict[str, Any] = {}
-        for expression in self.update_expressions:
-            if isinstance(expression, BaseUpdateOperator):
-                query.update(expression.query)
-            elif isinstance(expression, dict):
-                query.update(expression)
-            else:
-                raise TypeError("Wrong expression type")
-        return Encoder(custom_encoders=self.encoders).encode(query)
+        if (
+            self._cached_update_query is not None
+            and self._cached_version == self._version
+        ):
+            return self._cached_update_query
+        return self._build_update_query()
 
     def update(
         self,
@@ -86,10 +121,20 @@ class UpdateQuery(UpdateMethods, SessionMethods, RunInterface):
         :return: UpdateMany query
         """
         self.set_session(session=session)
-        self.update_expressions += args
+        for arg in args:
+            if isinstance(arg, BaseUpdateOperator):
+                expression = arg.query
+            elif isinstance(arg, dict):
+                expression = arg
+            else:
+                raise TypeError("Wrong expression type")
+            self.update_expressions.append(expression)
+            self._merged.update(expression)
+            self._version += 1
         if bulk_writer:
             self.bulk_writer = bulk_writer
-        self.pymongo_kwargs.update(pymongo_kwargs)
+        if pymongo_kwargs:
+            self.pymongo_kwargs = {**self.pymongo_kwargs, **pymongo_kwargs}
         return self
 
     def upsert(
@@ -117,6 +162,26 @@ class UpdateQuery(UpdateMethods, SessionMethods, RunInterface):
     def _update(self) -> UpdateResult:
         ...
 
+    @abstractmethod
+    def _pymongo_op(self) -> Union[UpdateOnePyMongo, UpdateManyPyMongo]:
+        ...
+
+    def to_pymongo_op(self) -> Union[UpdateOnePyMongo, UpdateManyPyMongo]:
+        """
+        Build the pymongo write request of the query
+        to use it with BulkWriter.extend.
+        Upsert queries with an `on_insert` document are not supported,
+        as the insert fallback can not be expressed as a write request
+
+        :return: Union[UpdateOne, UpdateMany] - pymongo write request
+        """
+        if self.upsert_insert_doc is not None:
+            raise NotSupported(
+                "Upsert with on_insert document can not be converted "
+                "to a pymongo write request"
+            )
+        return self._pymongo_op()
+
     def run(
         self,
     ) -> Union[UpdateResult, InsertOneResult, Optional["DocType"]]:
@@ -124,19 +189,26 @@ class UpdateQuery(UpdateMethods, SessionMethods, RunInterface):
         Run the query
         :return:
         """
+        if self.upsert_insert_doc is None:
+            return self._update()
+        return self._run_upsert()
 
+    def _run_upsert(
+        self,
+    ) -> Union[UpdateResult, InsertOneResult, Optional["DocType"]]:
+        """
+        Run the query and insert the upsert document
+        if nothing was matched
+        :return:
+        """
         update_result = self._update()
-        if self.upsert_insert_doc is None:
-            return update_result
-        else:
-            if update_result is not None and update_result.matched_count == 0:
-                return self.document_model.insert_one(
-                    document=self.upsert_insert_doc,
-                    session=self.session,
-                    bulk_writer=self.bulk_writer,
-                )
-            else:
-                return update_result
+        if update_result is not None and update_result.matched_count == 0:
+            return self.document_model.insert_one(
+                document=self.upsert_insert_doc,  # type: ignore
+                session=self.session,
+                bulk_writer=self.bulk_writer,
+            )
+        return update_result
 
 
 class UpdateMany(UpdateQuery):
@@ -148,6 +220,8 @@ class UpdateMany(UpdateQuery):
     - [UpdateQuery](https://roman-right.github.io/bunnet/api/queries/#updatequery)
     """
 
+    __slots__ = ()
+
     def update_many(
         self,
         *args: Mapping[str, Any],
@@ -168,6 +242,11 @@ class UpdateMany(UpdateQuery):
             *args, session=session, bulk_writer=bulk_writer, **pymongo_kwargs
         )
 
+    def _pymongo_op(self) -> UpdateManyPyMongo:
+        return UpdateManyPyMongo(
+            self.find_query, self.update_query, **self.pymongo_kwargs
+        )
+
     def _update(self):
         if self.bulk_writer is None:
             return self.document_model.get_motor_collection().update_many(
@@ -177,14 +256,9 @@ class UpdateMany(UpdateQuery):
                 **self.pymongo_kwargs,
             )
         else:
-            self.bulk_writer.add_operation(
-                Operation(
-                    operation=UpdateManyPyMongo,
-                    first_query=self.find_query,
-                    second_query=self.update_query,
-                    object_class=self.document_model,
-                    pymongo_kwargs=self.pymongo_kwargs,
-                )
+            self.bulk_writer.add_request(
+                self.document_model.get_motor_collection(),
+                self._pymongo_op(),
             )
 
 
@@ -197,6 +271,8 @@ class UpdateOne(UpdateQuery):
     - [UpdateQuery](https://roman-right.github.io/bunnet/api/queries/#updatequery)
     """
 
+    __slots__ = ()
+
     def update_one(
         self,
         *args: Mapping[str, Any],
@@ -217,6 +293,11 @@ class UpdateOne(UpdateQuery):
             *args, session=session, bulk_writer=bulk_writer, **pymongo_kwargs
         )
 
+    def _pymongo_op(self) -> UpdateOnePyMongo:
+        return UpdateOnePyMongo(
+            self.find_query, self.update_query, **self.pymongo_kwargs
+        )
+
     def _update(self):
         if not self.bulk_writer:
             return self.document_model.get_motor_collection().update_one(
@@ -226,12 +307,7 @@ class UpdateOne(UpdateQuery):
                 **self.pymongo_kwargs,
             )
         else:
-            self.bulk_writer.add_operation(
-                Operation(
-                    operation=UpdateOnePyMongo,
-                    first_query=self.find_query,
-                    second_query=self.update_query,
-                    object_class=self.document_model,
-                    pymongo_kwargs=self.pymongo_kwargs,
-                )
+            self.bulk_writer.add_request(
+                self.document_model.get_motor_collection(),
+                self._pymongo_op(),
             )
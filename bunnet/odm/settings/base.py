@@ -1,10 +1,13 @@
 from datetime import timedelta
-from typing import Optional, Dict, Any, Type
+from typing import Optional, Dict, Any, Type, TypeVar
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, Field
 from pymongo.collection import Collection
 from pymongo.database import Database
 
+SettingsType = TypeVar("SettingsType", bound="ItemSettings")
+
 
 class ItemSettings(BaseModel):
     name: Optional[str]
@@ -24,3 +27,44 @@ class ItemSettings(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+
+    @classmethod
+    def from_model(cls: Type[SettingsType], model: Type) -> SettingsType:
+        """
+        Get the settings of the model class, not bound to a database.
+        The Settings inner class is parsed once per model class
+
+        :param model: Type - Document, View or UnionDoc class
+        :return: ItemSettings
+        """
+        model_settings = _parsed_settings.setdefault(model, {})
+        parsed_settings = model_settings.get(cls)
+        if parsed_settings is None:
+            parsed_settings = cls.parse_obj(
+                get_settings_vars(getattr(model, "Settings", None))
+            )
+            model_settings[cls] = parsed_settings
+        return parsed_settings.copy()  # type: ignore
+
+
+def get_settings_vars(settings_class: Optional[Type]) -> Dict[str, Any]:
+    """
+    Get the public attributes of the Settings inner class
+
+    :param settings_class: Optional[Type] - Settings inner class
+    :return: Dict[str, Any]
+    """
+    if settings_class is None:
+        return {}
+    return {
+        key: value
+        for key, value in vars(settings_class).items()
+        if not key.startswith("_")
+    }
+
+
+# parsed settings of the model classes by the settings class,
+# without the database bindings
+_parsed_settings: "WeakKeyDictionary[Type, Dict[Type, ItemSettings]]" = (
+    WeakKeyDictionary()
+)
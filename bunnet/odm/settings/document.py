@@ -6,7 +6,7 @@ from pymongo import IndexModel
 from pymongo.database import Database
 
 from bunnet.exceptions import MongoDBVersionError
-from bunnet.odm.settings.base import ItemSettings
+from bunnet.odm.settings.base import ItemSettings, get_settings_vars
 from bunnet.odm.settings.timeseries import TimeSeriesConfig
 
 
@@ -40,11 +40,6 @@ class DocumentSettings(ItemSettings):
         allow_index_dropping: bool,
     ) -> "DocumentSettings":
 
-        settings_class = getattr(document_model, "Settings", None)
-        settings_vars = (
-            {} if settings_class is None else dict(vars(settings_class))
-        )
-
         # deprecated Collection class support
 
         collection_class = getattr(document_model, "Collection", None)
@@ -54,16 +49,15 @@ class DocumentSettings(ItemSettings):
                 "Collection inner class is deprecated, use Settings instead",
                 DeprecationWarning,
             )
-
-        collection_vars = (
-            {} if collection_class is None else dict(vars(collection_class))
-        )
-
-        settings_vars.update(collection_vars)
-
-        # ------------------------------------ #
-
-        document_settings = DocumentSettings.parse_obj(settings_vars)
+            settings_class = getattr(document_model, "Settings", None)
+            document_settings = cls.parse_obj(
+                {
+                    **get_settings_vars(settings_class),
+                    **get_settings_vars(collection_class),
+                }
+            )
+        else:
+            document_settings = cls.from_model(document_model)
 
         document_settings.motor_db = database
 
@@ -80,14 +74,15 @@ class DocumentSettings(ItemSettings):
             document_settings.name = document_model.__name__
 
         # check mongodb version
-        build_info: Dict[str, str] = database.command({"buildInfo": 1})
-        mongo_version = build_info["version"]
-        major_version = int(mongo_version.split(".")[0])
-
-        if document_settings.timeseries is not None and major_version < 5:
-            raise MongoDBVersionError(
-                "Timeseries are supported by MongoDB version 5 and higher"
-            )
+        if document_settings.timeseries is not None:
+            build_info: Dict[str, str] = database.command({"buildInfo": 1})
+            mongo_version = build_info["version"]
+            major_version = int(mongo_version.split(".")[0])
+
+            if major_version < 5:
+                raise MongoDBVersionError(
+                    "Timeseries are supported by MongoDB version 5 and higher"
+                )
 
         # create motor collection
         if (
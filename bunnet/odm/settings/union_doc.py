@@ -8,9 +8,7 @@ from bunnet.odm.settings.base import ItemSettings
 class UnionDocSettings(ItemSettings):
     @classmethod
     def init(cls, doc_class: Type, database: Database) -> "UnionDocSettings":
-        settings_class = getattr(doc_class, "Settings", None)
-
-        multi_doc_settings = cls.parse_obj(vars(settings_class))
+        multi_doc_settings = cls.from_model(doc_class)
 
         if multi_doc_settings.name is None:
             multi_doc_settings.name = doc_class.__name__
@@ -12,12 +12,14 @@ class ViewSettings(ItemSettings):
     pipeline: List[Dict[str, Any]]
 
     @classmethod
-    def init(cls, view_class: Type, database: Database) -> "ViewSettings":
-        settings_class = getattr(view_class, "Settings", None)
-        if settings_class is None:
+    def from_model(cls, model: Type) -> "ViewSettings":
+        if getattr(model, "Settings", None) is None:
             raise ViewHasNoSettings("View must have Settings inner class")
+        return super().from_model(model)
 
-        view_settings = cls.parse_obj(vars(settings_class))
+    @classmethod
+    def init(cls, view_class: Type, database: Database) -> "ViewSettings":
+        view_settings = cls.from_model(view_class)
 
         if view_settings.name is None:
             view_settings.name = view_class.__name__
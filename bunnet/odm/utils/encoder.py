@@ -51,6 +51,18 @@ ENCODERS_BY_TYPE: Dict[Type[Any], Callable[[Any], Any]] = {
     UUID: lambda u: bson.Binary.from_uuid(u),
 }
 
+# types, which are stored by BSON as is and never changed by the encoder
+BSON_PRIMITIVE_TYPES = frozenset(
+    (str, int, float, bool, type(None), datetime, ObjectId)
+)
+
+
+def is_bson_primitive(obj: Any) -> bool:
+    """
+    Check if the object is a BSON primitive, which does not need encoding
+    """
+    return type(obj) in BSON_PRIMITIVE_TYPES
+
 
 class Encoder:
     """
@@ -123,16 +123,13 @@ class Initializer:
         to init settings
         :return: None
         """
-        settings_class = getattr(cls, "Settings", None)
-        settings_vars = (
-            {} if settings_class is None else dict(vars(settings_class))
-        )
         if issubclass(cls, Document):
-            cls._document_settings = DocumentSettings.parse_obj(settings_vars)
+            cls._document_settings = DocumentSettings.from_model(cls)
+            cls._cached_update_encoder = None
         if issubclass(cls, View):
-            cls._settings = ViewSettings.parse_obj(settings_vars)
+            cls._settings = ViewSettings.from_model(cls)
         if issubclass(cls, UnionDoc):
-            cls._settings = UnionDocSettings.parse_obj(settings_vars)
+            cls._settings = UnionDocSettings.from_model(cls)
 
     # Document
 
@@ -220,14 +217,15 @@ class Initializer:
             document_settings.name = cls.__name__
 
         # check mongodb version
-        build_info = self.database.command({"buildInfo": 1})
-        mongo_version = build_info["version"]
-        major_version = int(mongo_version.split(".")[0])
-
-        if document_settings.timeseries is not None and major_version < 5:
-            raise MongoDBVersionError(
-                "Timeseries are supported by MongoDB version 5 and higher"
-            )
+        if document_settings.timeseries is not None:
+            build_info = self.database.command({"buildInfo": 1})
+            mongo_version = build_info["version"]
+            major_version = int(mongo_version.split(".")[0])
+
+            if major_version < 5:
+                raise MongoDBVersionError(
+                    "Timeseries are supported by MongoDB version 5 and higher"
+                )
 
         # create motor collection
         if (
@@ -70,6 +70,15 @@ def settings():
     return Settings()
 
 
+@pytest.fixture(scope="session")
+def mongo_major_version():
+    settings = Settings()
+    cli = MongoClient(settings.mongodb_dsn)
+    build_info = cli[settings.mongodb_db_name].command({"buildInfo": 1})
+    cli.close()
+    return int(build_info["version"].split(".")[0])
+
+
 @pytest.fixture()
 def cli(settings):
     return MongoClient(settings.mongodb_dsn)
@@ -1,9 +1,16 @@
 import pytest
+from pymongo import InsertOne, UpdateOne
 from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
 
 from bunnet.odm.bulk import BulkWriter
 from bunnet.odm.operators.update.general import Set
-from tests.models import DocumentTestModel, SubDocument
+from bunnet.odm.utils.dump import get_dict
+from tests.models import (
+    DocumentTestModel,
+    DocumentTestModelWithCustomCollectionName,
+    SubDocument,
+)
 
 
 def test_insert(documents_not_inserted):
@@ -93,12 +100,156 @@ def test_replace(documents, document_not_inserted):
     )
 
 
+def test_multiple_models(documents_not_inserted):
+    documents = documents_not_inserted(2)
+    with BulkWriter() as bulk_writer:
+        DocumentTestModel.insert_one(documents[0], bulk_writer=bulk_writer)
+        DocumentTestModelWithCustomCollectionName.insert_one(
+            DocumentTestModelWithCustomCollectionName(
+                test_int=1, test_list=[], test_str="foo"
+            ),
+            bulk_writer=bulk_writer,
+        )
+        DocumentTestModel.insert_one(documents[1], bulk_writer=bulk_writer)
+
+    assert len(DocumentTestModel.find_all().to_list()) == 2
+    assert (
+        len(DocumentTestModelWithCustomCollectionName.find_all().to_list())
+        == 1
+    )
+
+
+def test_commit_clears_requests(documents_not_inserted):
+    documents = documents_not_inserted(2)
+    with BulkWriter() as bulk_writer:
+        DocumentTestModel.insert_one(documents[0], bulk_writer=bulk_writer)
+        bulk_writer.commit()
+        assert bulk_writer.ops == []
+        DocumentTestModel.insert_one(documents[1], bulk_writer=bulk_writer)
+
+    assert len(DocumentTestModel.find_all().to_list()) == 2
+
+
+def test_max_batch_size(documents_not_inserted):
+    documents = documents_not_inserted(3)
+    with BulkWriter(max_batch_size=2) as bulk_writer:
+        for document in documents:
+            DocumentTestModel.insert_one(document, bulk_writer=bulk_writer)
+        assert DocumentTestModel.count() == 2
+        assert len(bulk_writer.ops) == 1
+
+    assert DocumentTestModel.count() == 3
+
+
+def test_extend(documents):
+    documents(5)
+    queries = [
+        DocumentTestModel.find_one(DocumentTestModel.test_int == i).set(
+            {DocumentTestModel.test_str: "extended"}
+        )
+        for i in range(3)
+    ]
+    with BulkWriter() as bulk_writer:
+        bulk_writer.extend(
+            DocumentTestModel.get_motor_collection(),
+            (query.to_pymongo_op() for query in queries),
+        )
+
+    assert (
+        len(
+            DocumentTestModel.find(
+                DocumentTestModel.test_str == "extended"
+            ).to_list()
+        )
+        == 3
+    )
+
+
+def test_extend_max_batch_size(documents_not_inserted):
+    documents = documents_not_inserted(5)
+    with BulkWriter(max_batch_size=2) as bulk_writer:
+        bulk_writer.extend(
+            DocumentTestModel.get_motor_collection(),
+            (
+                InsertOne(get_dict(document, to_db=True))
+                for document in documents
+            ),
+        )
+        assert DocumentTestModel.count() == 4
+        assert len(bulk_writer.ops) == 1
+
+    assert DocumentTestModel.count() == 5
+
+
+def test_write_options(documents_not_inserted, monkeypatch):
+    collection_class = type(DocumentTestModel.get_motor_collection())
+    bulk_write = collection_class.bulk_write
+    calls = []
+
+    def recording_bulk_write(collection, requests, **kwargs):
+        calls.append((collection.write_concern, kwargs))
+        return bulk_write(collection, requests, **kwargs)
+
+    monkeypatch.setattr(collection_class, "bulk_write", recording_bulk_write)
+
+    write_concern = WriteConcern(w="majority")
+    documents = documents_not_inserted(2)
+    with BulkWriter(
+        write_concern=write_concern, bypass_document_validation=True
+    ) as bulk_writer:
+        for document in documents:
+            DocumentTestModel.insert_one(document, bulk_writer=bulk_writer)
+
+    assert len(calls) == 1
+    assert calls[0][0] == write_concern
+    assert calls[0][1]["bypass_document_validation"] is True
+    assert len(DocumentTestModel.find_all().to_list()) == 2
+
+
 def test_internal_error(document):
     with pytest.raises(BulkWriteError):
         with BulkWriter() as bulk_writer:
             DocumentTestModel.insert_one(document, bulk_writer=bulk_writer)
 
 
+def test_failed_collection_keeps_unsent_requests(document):
+    other_document = DocumentTestModelWithCustomCollectionName(
+        test_int=1, test_list=[], test_str="foo"
+    )
+    bulk_writer = BulkWriter()
+    DocumentTestModel.insert_one(document, bulk_writer=bulk_writer)
+    DocumentTestModelWithCustomCollectionName.insert_one(
+        other_document, bulk_writer=bulk_writer
+    )
+    with pytest.raises(BulkWriteError):
+        bulk_writer.commit()
+
+    assert len(bulk_writer.ops) == 1
+    assert (
+        bulk_writer.ops[0][0]
+        == DocumentTestModelWithCustomCollectionName.get_motor_collection()
+    )
+    assert DocumentTestModelWithCustomCollectionName.count() == 0
+
+    bulk_writer.commit()
+    assert bulk_writer.ops == []
+    assert DocumentTestModelWithCustomCollectionName.count() == 1
+
+
+def test_failed_auto_commit_is_not_repeated(document):
+    with pytest.raises(BulkWriteError):
+        with BulkWriter(max_batch_size=2) as bulk_writer:
+            bulk_writer.add_request(
+                DocumentTestModel.get_motor_collection(),
+                UpdateOne({"_id": document.id}, {"$inc": {"test_int": 1}}),
+            )
+            DocumentTestModel.insert_one(document, bulk_writer=bulk_writer)
+
+    assert bulk_writer.ops == []
+    new_document = DocumentTestModel.get(document.id).run()
+    assert new_document.test_int == document.test_int + 1
+
+
 def test_native_upsert_found(documents, document_not_inserted):
     documents(5)
     document_not_inserted.test_int = -1000
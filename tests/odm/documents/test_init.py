@@ -63,6 +63,17 @@ def test_collection_with_custom_name():
     assert collection.name == "custom"
 
 
+def test_settings_reinit(db):
+    settings = DocumentTestModelWithCustomCollectionName.get_settings()
+    init_bunnet(
+        database=db,
+        document_models=[DocumentTestModelWithCustomCollectionName],
+    )
+    new_settings = DocumentTestModelWithCustomCollectionName.get_settings()
+    assert new_settings is not settings
+    assert new_settings.name == settings.name == "custom"
+
+
 def test_simple_index_creation():
     collection = DocumentTestModelWithSimpleIndex.get_motor_collection()
     index_info = collection.index_information()
@@ -1,8 +1,16 @@
+from decimal import Decimal
 from time import sleep
 
 import pytest
-
-from bunnet.odm.operators.update.general import Set, Max
+from bson import Decimal128
+
+from bunnet.exceptions import NotSupported
+from bunnet.odm.operators.update.general import (
+    Set,
+    Max,
+    Unset,
+    CurrentDate,
+)
 from tests.models import Sample
 
 
@@ -48,6 +56,17 @@ def test_update_query():
         Sample.find_many(Sample.integer == 1).update(40).update_query
 
 
+def test_update_query_cache():
+    q = Sample.find_many(Sample.integer == 1).update(Set({Sample.integer: 10}))
+    assert q.update_query is q.update_query
+
+    q.update(Max({Sample.increment: 5}))
+    assert q.update_query == {
+        "$set": {"integer": 10},
+        "$max": {"increment": 5},
+    }
+
+
 def test_update_many(preset_documents):
     Sample.find_many(Sample.increment > 4).find_many(
         Sample.nested.optional == None
@@ -209,3 +228,35 @@ def test_update_pymongo_kwargs(preset_documents):
     Sample.find_one(Sample.increment > 4).update(
         Set({Sample.increment: 100}), hint="integer_1"
     ).run()
+
+
+def test_update_encoder_is_shared():
+    q1 = Sample.find_many(Sample.integer == 1).set({Sample.integer: 10})
+    q2 = Sample.find_one(Sample.integer == 2).set({Sample.integer: 20})
+    assert q1._encoder is q2._encoder
+
+
+def test_update_query_operators_encode_values():
+    q = Sample.find_many(Sample.integer == 1).update(
+        Unset({Sample.optional: Decimal("1")}),
+        CurrentDate({Sample.timestamp: True}),
+    )
+    assert q.update_query == {
+        "$unset": {"optional": Decimal128("1")},
+        "$currentDate": {"timestamp": True},
+    }
+
+
+def test_upsert_to_pymongo_op_not_supported(sample_doc_not_saved):
+    q = Sample.find_one(Sample.integer > 100000).upsert(
+        Set({Sample.integer: 100}), on_insert=sample_doc_not_saved
+    )
+    with pytest.raises(NotSupported):
+        q.to_pymongo_op()
+
+
+def test_update_query_has_no_dict():
+    q = Sample.find_many(Sample.integer == 1).set({Sample.integer: 10})
+    assert not hasattr(q, "__dict__")
+    q = Sample.find_one(Sample.integer == 1).set({Sample.integer: 10})
+    assert not hasattr(q, "__dict__")
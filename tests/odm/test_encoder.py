@@ -2,7 +2,7 @@ from datetime import datetime, date
 
 from bson import Binary
 
-from bunnet.odm.utils.encoder import Encoder
+from bunnet.odm.utils.encoder import Encoder, is_bson_primitive
 from tests.models import (
     DocumentForEncodingTest,
     DocumentForEncodingTestDate,
@@ -50,3 +50,13 @@ def test_bytes_already_binary():
     encoded_b = Encoder().encode(b)
     assert isinstance(encoded_b, Binary)
     assert encoded_b.subtype == 3
+
+
+def test_is_bson_primitive():
+    assert is_bson_primitive(1)
+    assert is_bson_primitive("test")
+    assert is_bson_primitive(None)
+    assert is_bson_primitive(datetime.now())
+    assert not is_bson_primitive(b"test")
+    assert not is_bson_primitive({"test": 1})
+    assert not is_bson_primitive(date.today())
@@ -5,15 +5,12 @@ from bunnet.exceptions import MongoDBVersionError
 from tests.models import DocumentWithTimeseries
 
 
-def test_timeseries_collection(db):
-    build_info = db.command({"buildInfo": 1})
-    mongo_version = build_info["version"]
-    major_version = int(mongo_version.split(".")[0])
-    if major_version < 5:
+def test_timeseries_collection(db, mongo_major_version):
+    if mongo_major_version < 5:
         with pytest.raises(MongoDBVersionError):
             init_bunnet(database=db, document_models=[DocumentWithTimeseries])
 
-    if major_version >= 5:
+    if mongo_major_version >= 5:
         init_bunnet(database=db, document_models=[DocumentWithTimeseries])
         info = db.command(
             {
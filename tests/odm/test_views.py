@@ -17,3 +17,13 @@ class TestViews:
         ).to_list()
         assert len(results) == 3
         assert results[0]["test_field"] == 1
+
+    def test_settings_reinit(self, db):
+        settings = TestView.get_settings()
+        TestView.init_settings(db)
+        new_settings = TestView.get_settings()
+        assert new_settings is not settings
+        assert new_settings.name == settings.name
+        assert new_settings.source == settings.source
+        assert new_settings.pipeline == settings.pipeline
+        assert new_settings.motor_db is db